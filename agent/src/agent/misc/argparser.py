@@ -1,17 +1,26 @@
 from __future__ import annotations
 
-from argparse import ArgumentParser
+from argparse import ArgumentParser, HelpFormatter
 from typing import TYPE_CHECKING, NamedTuple, cast
 
-from rich_argparse import RichHelpFormatter
-
 from .logging_conf import LOG_ABBREV_2_LVL, LOG_LVL_2_COLOR
 
 if TYPE_CHECKING:
     from .logging_conf import LogLvl
 
 
-def _mk_parser() -> ArgumentParser:
+def _help_formatter(prog: str) -> HelpFormatter:
+    """Build the help formatter for `prog`.
+
+    argparse only instantiates its formatter when it actually renders help
+    or usage text (`-h`/`--help`, or an argument error), so `rich_argparse`
+    (and its global style mutation) is imported lazily here - normal startup
+    never pays for it, while every render path still gets the markup-aware
+    formatter.
+    """
+
+    from rich_argparse import RichHelpFormatter  # noqa: PLC0415
+
     RichHelpFormatter.usage_markup = True
     RichHelpFormatter.styles.update(
         {
@@ -22,10 +31,13 @@ def _mk_parser() -> ArgumentParser:
             "argparse.prog": "cyan bold",
         },
     )
+    return RichHelpFormatter(prog)
+
 
+def _mk_parser() -> ArgumentParser:
     parser = ArgumentParser(
         description="UART bridge for Whac-A-Mole device",
-        formatter_class=RichHelpFormatter,
+        formatter_class=cast("type[HelpFormatter]", _help_formatter),
         usage="%(prog)s [cyan]-s [dim]P[/] \\[options][/]",
     )
 
@@ -2,8 +2,6 @@ import os
 import sys
 from typing import Final, TypedDict
 
-from dotenv import load_dotenv
-
 from agent.__init__ import __prog__
 
 from .utils import cerr
@@ -17,52 +15,36 @@ class _MqttConf(TypedDict):
     mqtt_port: int
 
 
-def _ensure_valid_port(name: str) -> int:
-    val = os.getenv(name)
-    if val is None or not val.strip():
-        msg = f"[cyan]{name}[/] is not set"
-        raise ValueError(msg)
-
-    try:
-        port = int(val)
-    except ValueError as e:
-        msg = f"[cyan]{name}[/] is not an integer: {val}"
-        raise ValueError(msg) from e
-    else:
-        if not (_PORT_MIN <= port <= _PORT_MAX):
-            msg = f"[cyan]{name}[/] is out of range: {val}"
-            raise ValueError(msg)
-
-    return port
-
-
-def _ensure_valid_broker(name: str) -> str:
-    val = os.getenv(name)
-    if val is None or not val.strip():
-        msg = f"[cyan]{name}[/] is not set"
-        raise ValueError(msg)
-
-    return val
-
-
 def get_env_vars() -> _MqttConf:
-    load_dotenv()
+    # dotenv only matters when the process env is incomplete - skip its
+    # import and file walk otherwise (deployed environments set the vars
+    # directly). When it does run, load_dotenv keeps its usual upward search
+    # for a .env file, so the agent still finds it from any working directory
+    if "MQTT_BROKER" not in os.environ or "MQTT_PORT" not in os.environ:
+        from dotenv import load_dotenv  # noqa: PLC0415
 
-    errs: list[str] = []
-    broker: str | None = None
-    port: int | None = None
+        load_dotenv()
 
-    try:
-        broker = _ensure_valid_broker("MQTT_BROKER")
-    except ValueError as e:
-        errs.append(str(e))
+    errs: list[str] = []
 
-    try:
-        port = _ensure_valid_port("MQTT_PORT")
-    except ValueError as e:
-        errs.append(str(e))
+    broker = os.environ.get("MQTT_BROKER", "").strip()
+    if not broker:
+        errs.append("[cyan]MQTT_BROKER[/] is not set")
 
-    if broker is None or port is None:
+    port = 0
+    port_s = os.environ.get("MQTT_PORT", "").strip()
+    if not port_s:
+        errs.append("[cyan]MQTT_PORT[/] is not set")
+    else:
+        try:
+            port = int(port_s)
+        except ValueError:
+            errs.append(f"[cyan]MQTT_PORT[/] is not an integer: {port_s}")
+        else:
+            if not (_PORT_MIN <= port <= _PORT_MAX):
+                errs.append(f"[cyan]MQTT_PORT[/] is out of range: {port_s}")
+
+    if errs:
         cerr.print("".join(f"[bold bright_red]{__prog__}: env-error:[/] {e}\n" for e in errs), end="")
         sys.exit(1)
 
@@ -28,6 +28,34 @@ LOG_LVL_2_COLOR: Final = {
 }
 
 
+# strftime("%X") cache: records within the same second share one libc call
+_last_ts: tuple[int, str] = (0, "")
+
+
+def _time_str() -> str:
+    global _last_ts  # noqa: PLW0603
+
+    now = int(time.time())
+    if now != _last_ts[0]:
+        _last_ts = (now, time.strftime("%X", time.localtime(now)))
+    return _last_ts[1]
+
+
+# Per-level constant head of every record line - only the time and message
+# vary per emit, so the markup is interpolated once at import
+_LINE_PFX: Final = {
+    lvl: f"[dim][{color}][{abbrev}][/] [white]("
+    for (abbrev, lvl), color in zip(LOG_ABBREV_2_LVL.items(), LOG_LVL_2_COLOR.values(), strict=True)
+}
+_LINE_SFX: Final = ")[/] ::[/] "
+
+# WARNING+ messages are colored too; folding the open tag into the suffix
+# saves wrapping the message in a fresh f-string per record
+_LINE_SFX_COLORED: Final = {
+    lvl: f"{_LINE_SFX}[{color}]" for lvl, color in LOG_LVL_2_COLOR.items() if lvl >= logging.WARNING
+}
+
+
 class _RichStyleHandler(logging.Handler):
     """Logging handler with Rich markup support and custom format."""
 
@@ -41,7 +69,12 @@ class _RichStyleHandler(logging.Handler):
 
     @override
     def emit(self, record: logging.LogRecord) -> None:
-        fmted = _RichStyleHandler._fmt_msg(self.format(record), cast("LogLvl", record.levelno))
+        # Fast path: with no args/exc/stack the Formatter walk would return
+        # record.msg unchanged, so skip it
+        needs_format = record.args or record.exc_info or record.stack_info
+        msg = self.format(record) if needs_format else str(record.msg)
+
+        fmted = _RichStyleHandler._fmt_msg(msg, cast("LogLvl", record.levelno))
         if fmted is None:
             self.handleError(record)
             return
@@ -52,14 +85,14 @@ class _RichStyleHandler(logging.Handler):
     @classmethod
     def _fmt_msg(cls, msg: str, lvlno: LogLvl) -> str | None:
         try:
-            color = LOG_LVL_2_COLOR[lvlno]
-            lvl_abbrev = _RichStyleHandler.LVL_2_ABBREV[lvlno]
-            time_str = time.strftime("%X")
-            msg = f"[{color}]{msg}[/]" if lvlno >= logging.WARNING else msg
+            pfx = _LINE_PFX[lvlno]
         except KeyError:
             return None
 
-        return f"[dim][{color}][{lvl_abbrev}][/] [white]({time_str})[/] ::[/] {msg}"
+        if lvlno >= logging.WARNING:
+            return pfx + _time_str() + _LINE_SFX_COLORED[lvlno] + msg + "[/]"
+
+        return pfx + _time_str() + _LINE_SFX + msg
 
 
 def init_logging(lvl: LogLvl) -> None:
@@ -1,12 +1,30 @@
-from time import time
+from time import time_ns
+from typing import Any
 
 from rich.console import Console
 
-# Handles
-cout = Console()
-cerr = Console(stderr=True)
+try:
+    from orjson import dumps as json_dumps
+    from orjson import loads as json_loads
+except ImportError:  # No orjson wheel for this platform - fall back to stdlib
+    import json
+
+    def json_loads(data: bytes | str) -> Any:  # noqa: ANN401
+        """Deserialize JSON bytes/str."""
+        return json.loads(data)
+
+    def json_dumps(obj: Any) -> bytes:  # noqa: ANN401
+        """Serialize obj to compact JSON bytes."""
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+
+# Handles (no repr-highlighter regex scan or emoji substitution per print -
+# these only ever render pre-marked-up log lines)
+cout = Console(highlight=False, emoji=False, soft_wrap=True)
+cerr = Console(stderr=True, highlight=False, emoji=False, soft_wrap=True)
 
 
 def time_now_ms() -> int:
     """Return time in milliseconds since the Epoch."""
-    return int(time() * 1000)
+    # Pure integer path - no float round-trip
+    return time_ns() // 1_000_000
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-import json
+import contextlib
 import logging
-from typing import TYPE_CHECKING, Any, ClassVar, Literal, TypedDict
+import socket
+from typing import TYPE_CHECKING, Any, ClassVar, Literal
 
 from paho.mqtt.client import Client, ConnectFlags, DisconnectFlags, MQTTMessage, MQTTMessageInfo
 from paho.mqtt.enums import CallbackAPIVersion, MQTTErrorCode
@@ -16,18 +17,10 @@ if TYPE_CHECKING:
     from paho.mqtt.properties import Properties
     from paho.mqtt.reasoncodes import ReasonCode
 
-    type Topic = Literal["state", "commands", "game_events"]
     type CommandCallback = Callable[[bytes], None]
 
     type DevStatus = Literal["online", "serial_error", "offline"]
 
-    class CommonPayload(TypedDict):
-        device_id: str
-        ts: int
-
-    class StatusPayload(CommonPayload):
-        status: DevStatus
-
 
 class MqttClient:
     """Wrapper around paho-mqtt with connection management."""
@@ -42,6 +35,11 @@ class MqttClient:
 
     _log: Logger
     _client: Client
+    _topic_state: str
+    _topic_events_batch: str
+    _topic_commands: str
+    _enrich_tail: bytes
+    _state_templates: dict[DevStatus, bytes]
 
     def __init__(
         self,
@@ -59,6 +57,23 @@ class MqttClient:
         self.topic = topic
         self.on_command = on_command
 
+        # Topics are fixed for the client's lifetime - format once instead of
+        # rebuilding an f-string per publish (paho wants str; it encodes internally)
+        self._topic_state = f"{topic}/{device_id}/state"
+        self._topic_events_batch = f"{topic}/{device_id}/game_events_batch"
+        self._topic_commands = f"{topic}/{device_id}/commands"
+
+        # Constant head of the enrichment spliced into each raw event line;
+        # only the timestamp digits vary per batch
+        self._enrich_tail = f',"device_id":"{device_id}","ts":'.encode()
+
+        # State payloads are one of three fixed shapes with only ts varying -
+        # a %d substitution instead of dict build + JSON serialization
+        self._state_templates = {
+            s: f'{{"device_id":"{device_id}","status":"{s}","ts":%d}}'.encode()
+            for s in ("online", "serial_error", "offline")
+        }
+
         self._log = logging.getLogger("MqttClient")
         self._client = Client(
             client_id=f"bridge-{device_id}",
@@ -68,11 +83,14 @@ class MqttClient:
         self._client.on_connect = self._on_connect
         self._client.on_disconnect = self._on_disconnect
         self._client.reconnect_delay_set(min_delay=1, max_delay=30)
+        # Let QoS >0 publishes overlap during bursts instead of stalling the
+        # send queue at paho's default of 20 in flight, and bound the queue
+        # so a dead broker can't grow it without limit
+        self._client.max_inflight_messages_set(100)
+        self._client.max_queued_messages_set(1000)
 
         # Set last will
-        pload = self._status_payload(last_will)
-        topic = f"{self.topic}/{self.device_id}/state"
-        self._client.will_set(topic, payload=json.dumps(pload), qos=2, retain=False)
+        self._client.will_set(self._topic_state, payload=self._state_payload(last_will), qos=1, retain=True)
         self._log.debug("Last will set to [bright_yellow]%s[/]", last_will)
 
     def connect(self) -> bool:
@@ -89,6 +107,13 @@ class MqttClient:
             self._log.critical("MQTT connect (loop start) failed with rc=%s", res2)
             return False
 
+        # Keep Nagle enabled so bursts of small PUBLISH frames coalesce into
+        # fewer TCP packets (near-zero latency cost on a LAN). Paho leaves
+        # this to the OS default; make it explicit.
+        if (sock := self._client.socket()) is not None:
+            with contextlib.suppress(OSError):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 0)
+
         self._log.info("Connected to [bright_magenta]%s:%d[/]", self.broker, self.port)
         return True
 
@@ -118,44 +143,63 @@ class MqttClient:
             MQTTMessageInfo for caller to wait on if needed
         """
 
-        return self._pub("state", self._status_payload(status), frm="Agent", to="MQTT")
+        # Retained so a dashboard (re)connecting between heartbeats sees the
+        # device's latest state immediately
+        return self._pub(self._topic_state, self._state_payload(status), frm="Agent", to="MQTT", retain=True)
 
-    def publish_event(self, event: Any) -> None:  # noqa: ANN401
-        """Publish game event to MQTT.
+    def publish_event_batch(self, events: list[bytes]) -> None:
+        """Publish a batch of raw game-event lines as a single MQTT message.
+
+        Each line is a validated `{...}` JSON object straight off the serial
+        port. Enrichment (device_id + ts) is spliced in as a bytes concat -
+        no parse/re-serialize round-trip per event.
 
         Args:
-            event: Game event
+            events: Raw JSON object lines (each is stamped with the common payload)
         """
 
-        pload = event | self._common_payload()
-        self._pub("game_events", pload, frm="Device", to="MQTT")
+        tail = self._enrich_tail + str(time_now_ms()).encode() + b"}"
+        # An empty object (`{}`, `{ }`, ...) has nothing to append after -
+        # drop the leading comma
+        pload = b"[%s]" % b",".join(line[:-1] + (tail if line[1:-1].strip() else tail[1:]) for line in events)
+        self._pub(self._topic_events_batch, pload, frm="Device", to="MQTT", qos=0)
 
     ################################################# Utility Methods ##################################################
 
-    def _common_payload(self) -> CommonPayload:
-        """Return common payload for outgoing MQTT messages."""
-        return {"device_id": self.device_id, "ts": time_now_ms()}
-
-    def _status_payload(self, status: DevStatus) -> StatusPayload:
-        """Return status payload for bridge state messages."""
-        return {**self._common_payload(), "status": status}
+    def _state_payload(self, status: DevStatus) -> bytes:
+        """Return the serialized state payload, stamped with the current time."""
+        return self._state_templates[status] % time_now_ms()
 
-    def _pub(self, topic: str, pload: CommonPayload | StatusPayload, *, frm: str, to: str) -> MQTTMessageInfo:
+    def _pub(
+        self,
+        topic: str,
+        pload: bytes,
+        *,
+        frm: str,
+        to: str,
+        qos: int = 1,
+        retain: bool = False,
+    ) -> MQTTMessageInfo:
         """Publish payload to given topic.
 
         Args:
-            topic: MQTT topic
-            pload: Payload
+            topic: Full (pre-formatted) MQTT topic
+            pload: Pre-serialized payload (goes on the wire as-is)
 
         Keywords Args:
             frm: Source
             to: Destination
+            qos: MQTT QoS level (0 for lossy-tolerant telemetry)
+            retain: Whether the broker should retain the message for new subscribers
 
         Returns:
             MQTTMessageInfo for caller to wait on if needed
         """
-        self._log.debug("[bright_white on grey30][%s -> %s][/] %s", frm, to, pload)
-        res = self._client.publish(f"{self.topic}/{self.device_id}/{topic}", json.dumps(pload), qos=2)
+        # Guarded so the markup-laden record is never built when DEBUG is
+        # filtered out (this runs once per event batch)
+        if self._log.isEnabledFor(logging.DEBUG):
+            self._log.debug("[bright_white on grey30][%s -> %s][/] %s", frm, to, pload)
+        res = self._client.publish(topic, pload, qos=qos, retain=retain)
 
         if res.rc != MQTTErrorCode.MQTT_ERR_SUCCESS:
             self._log.error("MQTT publish failed with rc=%s", res.rc)
@@ -195,7 +239,7 @@ class MqttClient:
             self._log.warning("MQTT connect failed with rc=%s", reason_code)
             return
 
-        self._sub(client, f"{self.topic}/{self.device_id}/commands")
+        self._sub(client, self._topic_commands)
         # self._sub(client, f"{self.topic}/all/commands")  # noqa: ERA001
         _ = userdata, connect_flags, properties
 
@@ -12,8 +12,10 @@ Architecture:
                                      --> Leaderboard (persisted to JSON)
 """
 
+import heapq
 import threading
 import time
+from functools import lru_cache
 from typing import Any, Final
 
 import uvicorn
@@ -24,34 +26,64 @@ from .leaderboard import init as init_leaderboard
 from .mqtt import subscribe
 from .state import (
     DEV_LOCK,
-    MAX_PAST_SESSIONS,
     DeviceState,
     Session,
     devices,
+    refresh_snapshot,
 )
 
 # Device considered offline if no MQTT message received within this window
 # Set to 2.25x heartbeat interval (20s) to handle network hiccups
 DEVICE_TIMEOUT_MS: Final = 45_000
 
-# How often to check for timed-out devices (seconds)
-TIMEOUT_CHECK_INTERVAL: Final = 5
+# Offline deadlines, ordered soonest-first: (deadline_ms, device_id, gen).
+# Stale entries (gen != device.seen_gen) are discarded lazily on pop
+_timeout_heap: list[tuple[int, str, int]] = []
+_timeout_wakeup = threading.Event()
 
 
-def handle_message(data: dict[str, Any], topic: str) -> None:
+@lru_cache(maxsize=1024)
+def _topic_kind(topic: str) -> str:
+    """Return the trailing segment of an MQTT topic.
+
+    Cached: the key-space is one topic string per device per kind, so after
+    warm-up routing costs a dict hit instead of a split per message.
+    """
+    return topic.rsplit("/", 1)[-1]
+
+
+def handle_message(data: dict[str, Any] | list[dict[str, Any]], topic: str, now: int) -> None:
     """Route MQTT messages to appropriate handlers based on topic.
 
     Topics:
-        whac/<device_id>/state       -> handle_state()
-        whac/<device_id>/game_events -> handle_game_event()
+        whac/<device_id>/state             -> handle_state()
+        whac/<device_id>/game_events       -> handle_game_event()
+        whac/<device_id>/game_events_batch -> handle_game_event() per event
+
+    Args:
+        data: Decoded payload (an event list for batch topics)
+        topic: MQTT topic the message arrived on
+        now: Receive time in ms (read once in on_message, shared by handlers)
     """
-    if "/state" in topic:
-        handle_state(data)
-    elif "/game_events" in topic:
-        handle_game_event(data)
+    kind = _topic_kind(topic)
+    if kind == "state":
+        handle_state(data, now)
+    elif kind == "game_events_batch":
+        # Agent coalesces bursty events into one publish; unroll here
+        for event in data:
+            handle_game_event(event, now)
+    elif kind == "game_events":
+        handle_game_event(data, now)
+    else:
+        return
 
+    # One snapshot rebuild per message (not per unrolled event) keeps the
+    # pre-serialized /devices payload current for lock-free reads
+    with DEV_LOCK:
+        refresh_snapshot()
 
-def handle_state(data: dict[str, Any]) -> None:
+
+def handle_state(data: dict[str, Any], now: int) -> None:
     """Handle device state messages from Python agent.
 
     Auto-discovers new devices and updates connection status.
@@ -62,7 +94,6 @@ def handle_state(data: dict[str, Any]) -> None:
 
     device_id = data["device_id"]
     status = data.get("status")
-    now = int(time.time() * 1000)  # Use receive time, not message timestamp
 
     with DEV_LOCK:
         # Auto-discover: create DeviceState on first message from device
@@ -71,6 +102,7 @@ def handle_state(data: dict[str, Any]) -> None:
 
         device = devices[device_id]
         device.last_seen = now
+        _schedule_timeout(device, now)
 
         # Preserve error/offline status from agent; otherwise mark online
         if status in ("serial_error", "offline"):
@@ -79,7 +111,7 @@ def handle_state(data: dict[str, Any]) -> None:
             device.status = "online"
 
 
-def handle_game_event(data: dict[str, Any]) -> None:
+def handle_game_event(data: dict[str, Any], now: int) -> None:
     """Handle game events from embedded device (via agent).
 
     Tracks session lifecycle and calculates scores:
@@ -93,7 +125,6 @@ def handle_game_event(data: dict[str, Any]) -> None:
 
     device_id = data["device_id"]
     event_type = data.get("event_type")
-    now = int(time.time() * 1000)  # Use receive time, not message timestamp
     ts = data.get("ts", now)  # Keep message ts for session timestamps
 
     with DEV_LOCK:
@@ -103,6 +134,7 @@ def handle_game_event(data: dict[str, Any]) -> None:
 
         device = devices[device_id]
         device.last_seen = now
+        _schedule_timeout(device, now)
 
         if event_type == "session_start":
             device.game_state = "playing"
@@ -118,9 +150,8 @@ def handle_game_event(data: dict[str, Any]) -> None:
 
                 add_entry(device_id, device.current_session.score, ts)
 
-                # Archive session (keep last N sessions for history)
-                device.past_sessions.insert(0, device.current_session)
-                device.past_sessions = device.past_sessions[:MAX_PAST_SESSIONS]
+                # Archive session (deque maxlen keeps the last N for history)
+                device.past_sessions.appendleft(device.current_session)
             device.current_session = None
 
         elif event_type in ("pop_result", "lvl_complete"):
@@ -131,19 +162,51 @@ def handle_game_event(data: dict[str, Any]) -> None:
                 device.current_session.score = calculate_score(device.current_session.events)
 
 
+def _schedule_timeout(device: DeviceState, now: int) -> None:
+    """Arm (or re-arm) a device's offline deadline. Call with DEV_LOCK held."""
+    device.seen_gen += 1
+    entry = (now + DEVICE_TIMEOUT_MS, device.device_id, device.seen_gen)
+    heapq.heappush(_timeout_heap, entry)
+    # Only rouse the watchdog when this deadline became the soonest one
+    # (i.e. the heap was empty) - any other sleep it is in already ends at
+    # an earlier deadline, so waking it per message just burns lock traffic
+    if _timeout_heap[0] is entry:
+        _timeout_wakeup.set()
+
+
 def check_device_timeouts() -> None:
     """Background watchdog thread to detect offline devices.
 
     Marks devices as "offline" if no MQTT message received within DEVICE_TIMEOUT_MS.
     Catches cases where agent crashes without sending disconnect message.
+
+    Sleeps until the soonest heap deadline instead of scanning every device
+    on a fixed interval; each message re-arms its device, and outdated heap
+    entries are recognized by their stale generation counter and dropped.
     """
     while True:
-        time.sleep(TIMEOUT_CHECK_INTERVAL)
-        now = int(time.time() * 1000)
+        wait_s = None
         with DEV_LOCK:
-            for device in devices.values():
-                if device.status == "online" and (now - device.last_seen) > DEVICE_TIMEOUT_MS:
+            now = time.time_ns() // 1_000_000
+            while _timeout_heap:
+                deadline, device_id, gen = _timeout_heap[0]
+                device = devices.get(device_id)
+                if device is None or gen != device.seen_gen:
+                    heapq.heappop(_timeout_heap)  # Superseded by a newer message
+                    continue
+
+                if deadline > now:
+                    wait_s = (deadline - now) / 1000
+                    break
+
+                heapq.heappop(_timeout_heap)
+                if device.status == "online":
                     device.status = "offline"
+                    refresh_snapshot()
+
+        # Woken early when a new deadline is armed; blocks when no devices
+        _timeout_wakeup.wait(wait_s)
+        _timeout_wakeup.clear()
 
 
 def main() -> None:
@@ -157,7 +220,7 @@ def main() -> None:
     init_leaderboard()
 
     # Subscribe to all device topics using MQTT wildcards
-    topics = ["whac/+/game_events", "whac/+/state"]
+    topics = ["whac/+/game_events", "whac/+/game_events_batch", "whac/+/state"]
     client = subscribe(topics, handle_message)
 
     # Daemon threads auto-terminate when main exits
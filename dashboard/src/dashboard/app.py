@@ -10,19 +10,18 @@ subscribed to the device's command topic receives the command and writes
 it to the embedded device via UART.
 """
 
-from dataclasses import asdict
 from importlib.resources import files
 from pathlib import Path
 from typing import Any, Final
 
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import HTMLResponse
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 
 from dashboard.env import APP_ROOT_PATH
 from dashboard.leaderboard import get_leaderboard
 from dashboard.mqtt import pub_cmd
-from dashboard.state import DEV_LOCK, devices
+from dashboard.state import get_snapshot
 from dashboard.types import StatusOk
 
 # Game level boundaries (embedded device supports levels 1-8)
@@ -35,7 +34,9 @@ STATIC_DIR: Final = Path(str(files("dashboard") / "static"))
 # Inject <base> tag for subpath deployment (e.g., behind reverse proxy)
 BASE_TAG: Final = f'<base href="{APP_ROOT_PATH}/">' if APP_ROOT_PATH else ""
 
-app: Final = FastAPI()
+# ORJSONResponse skips the stdlib json.dumps (and its str round-trip) on
+# every JSON endpoint
+app: Final = FastAPI(default_response_class=ORJSONResponse)
 
 # Mount static directory for JS/CSS assets
 app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
@@ -50,10 +51,13 @@ async def dashboard() -> HTMLResponse:
 
 
 @app.get("/devices")
-async def get_devices() -> list[dict[str, Any]]:
-    """Return all known devices with their current state (polled by frontend)."""
-    with DEV_LOCK:
-        return [asdict(dev) for dev in devices.values()]
+async def get_devices() -> Response:
+    """Return all known devices with their current state (polled by frontend).
+
+    Serves the snapshot the MQTT writers keep pre-serialized - no lock, no
+    encoding work per poll.
+    """
+    return Response(get_snapshot(), media_type="application/json")
 
 
 @app.get("/leaderboard")
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-import json
 import os
 import socket
+import threading
+import time
 from typing import TYPE_CHECKING, Any
 
-from paho.mqtt import publish
+import orjson
 from paho.mqtt.client import Client, ConnectFlags, DisconnectFlags
 from paho.mqtt.enums import CallbackAPIVersion
 
@@ -23,6 +24,25 @@ if TYPE_CHECKING:
 
 from .env import BROKER, MQTT_PORT
 
+# Long-lived publisher for commands - publish.single would pay a full TCP +
+# MQTT CONNECT/DISCONNECT handshake per dashboard button press
+_publisher: Client | None = None
+_publisher_lock = threading.Lock()
+
+
+def _get_publisher() -> Client:
+    """Return the shared command publisher, connecting it on first use."""
+    global _publisher  # noqa: PLW0603
+    with _publisher_lock:
+        if _publisher is None:
+            client_id = f"dashboard-pub-{socket.gethostname()}-{os.getpid()}"
+            client = Client(client_id=client_id, callback_api_version=CallbackAPIVersion.VERSION2)
+            client.reconnect_delay_set(min_delay=1, max_delay=30)
+            client.connect(BROKER, MQTT_PORT)
+            client.loop_start()
+            _publisher = client
+    return _publisher
+
 
 def pub_cmd(device_id: str, cmd: str) -> StatusOk:
     """Publish a command to a given device.
@@ -34,18 +54,12 @@ def pub_cmd(device_id: str, cmd: str) -> StatusOk:
     Returns:
         StatusOk for caller to return
     """
-    publish.single(
-        f"whac/{device_id}/commands",
-        cmd,
-        hostname=BROKER,
-        port=MQTT_PORT,
-        qos=2,
-    )
+    _get_publisher().publish(f"whac/{device_id}/commands", cmd, qos=2)
 
     return {"ok": True}
 
 
-def subscribe(topics: list[str], handler: Callable[[dict[str, Any], str], None]) -> Client:
+def subscribe(topics: list[str], handler: Callable[[dict[str, Any] | list[dict[str, Any]], str, int], None]) -> Client:
     """Subscribe to MQTT topics.
 
     Args:
@@ -93,8 +107,12 @@ def subscribe(topics: list[str], handler: Callable[[dict[str, Any], str], None])
     ) -> None:
         _ = client, userdata
         try:
-            print(f"[MQTT] Received message on {message.topic}")
-            handler(json.loads(message.payload.decode()), message.topic)
+            # Receive time is read once here and threaded through the
+            # handlers (integer ns path - no float round-trip)
+            now_ms = time.time_ns() // 1_000_000
+            # orjson parses the payload bytes directly - no str copy, and
+            # no per-message print on the ingest path
+            handler(orjson.loads(message.payload), message.topic, now_ms)
         except Exception as e:
             print(f"[MQTT] Error processing message on {message.topic}: {e}")
 
@@ -11,9 +11,12 @@ Data Flow:
 """
 
 import threading
+from collections import deque
 from dataclasses import dataclass, field
 from typing import Any, Final
 
+import orjson
+
 from dashboard.types import DevGameState, DevStatus
 
 # Number of completed sessions to retain per device (for session history display)
@@ -33,6 +36,20 @@ class Session:
     won: bool | None = None
     score: int = 0
 
+    def to_json_obj(self) -> dict[str, Any]:
+        """Return a JSON-ready dict.
+
+        Unlike `dataclasses.asdict`, event dicts are referenced rather than
+        deep-copied - callers must serialize before releasing DEV_LOCK.
+        """
+        return {
+            "events": self.events,
+            "started_at": self.started_at,
+            "ended_at": self.ended_at,
+            "won": self.won,
+            "score": self.score,
+        }
+
 
 @dataclass
 class DeviceState:
@@ -46,10 +63,39 @@ class DeviceState:
     status: DevStatus = "offline"
     game_state: DevGameState = "idle"
     last_seen: int = 0  # Last MQTT message timestamp (ms)
+    seen_gen: int = 0  # Bumped per message; invalidates stale timeout-heap entries
     current_session: Session | None = None  # Active session (if playing)
-    past_sessions: list[Session] = field(default_factory=list)
+    # Bounded ring buffer, newest first: appendleft evicts the oldest in O(1)
+    past_sessions: deque[Session] = field(default_factory=lambda: deque(maxlen=MAX_PAST_SESSIONS))
+
+    def to_json_obj(self) -> dict[str, Any]:
+        """Return a JSON-ready dict (shallow; see Session.to_json_obj)."""
+        return {
+            "device_id": self.device_id,
+            "status": self.status,
+            "game_state": self.game_state,
+            "last_seen": self.last_seen,
+            "current_session": self.current_session.to_json_obj() if self.current_session else None,
+            "past_sessions": [s.to_json_obj() for s in self.past_sessions],
+        }
 
 
 # Global device registry - keyed by device_id
 # Protected by DEV_LOCK for thread safety
 devices: dict[str, DeviceState] = {}
+
+# Pre-serialized /devices payload, rebuilt by writers after each mutation.
+# Readers pick up the reference without touching DEV_LOCK (CPython attribute
+# assignment is atomic), so polling never blocks MQTT ingest
+_snapshot: bytes = b"[]"
+
+
+def refresh_snapshot() -> None:
+    """Re-serialize the devices snapshot. Must be called with DEV_LOCK held."""
+    global _snapshot  # noqa: PLW0603
+    _snapshot = orjson.dumps([dev.to_json_obj() for dev in devices.values()])
+
+
+def get_snapshot() -> bytes:
+    """Return the latest pre-serialized /devices payload (lock-free)."""
+    return _snapshot